@@ -166,8 +166,15 @@ def set_mode(mode_id: str):
     global _current_mode
 
     if mode_id in _mode_registry:
-        mode = Mode.new(mode_id)
-        mitsuba.set_variant(mode.kernel_variant)
+        if _current_mode is not None and _current_mode.id == mode_id:
+            mode = _current_mode
+        else:
+            mode = Mode.new(mode_id)
+
+        # Variant switching is costly: skip it if the kernel already runs the
+        # requested variant (e.g. when mode fixtures are entered repeatedly)
+        if mitsuba.variant() != mode.kernel_variant:
+            mitsuba.set_variant(mode.kernel_variant)
     elif mode_id == "none":
         mode = None
     else:
@@ -9,16 +9,25 @@ import pinttr
 def onedict_value(d):
     """Get the value of a single-entry dictionary."""
 
-    if len(d) != 1:
-        raise ValueError(f"dictionary has wrong length (expected 1, got {len(d)}")
+    # Unpacking checks the length and extracts the value in a single step
+    try:
+        (value,) = d.values()
+    except ValueError:
+        raise ValueError(
+            f"dictionary has wrong length (expected 1, got {len(d)})"
+        ) from None
 
-    return next(iter(d.values()))
+    return value
 
 
 def ensure_array(x, dtype=None):
     """Ensure that passed object is a Numpy array."""
     kwargs = dict(dtype=dtype) if dtype is not None else {}
 
+    # Arrays are copied directly instead of being iterated over element-wise
+    if isinstance(x, np.ndarray) and x.ndim > 0:
+        return np.array(x, **kwargs)
+
     return np.array(list(pinttr.util.always_iterable(x)), **kwargs)
 
 
@@ -1,6 +1,7 @@
 """attrs-based utility classes and functions"""
 
 import enum
+import sys
 from textwrap import dedent, indent
 
 import attr
@@ -37,23 +38,42 @@ Sentinel to indicate when a dynamic field value is expected to be set automatica
 """
 
 
-class MetadataKey(enum.Enum):
+class MetadataKey(str, enum.Enum):
     """Attribute metadata keys.
 
     These Enum values should be used as metadata attribute keys.
+
+    .. note:: Members are also strings: they are hashed (*e.g.* upon metadata
+       lookup) with the fast built-in string hash rather than with
+       :meth:`enum.Enum.__hash__`. Their values are namespaced to avoid
+       collisions with metadata keys used by other libraries.
     """
 
-    DOC = enum.auto()  #: Documentation for this field (str)
-    TYPE = enum.auto()  #: Documented type for this field (str)
-    DEFAULT = enum.auto()  #: Documented default value for this field (str)
+    DOC = "__eradiate_doc__"  #: Documentation for this field (str)
+    TYPE = "__eradiate_type__"  #: Documented type for this field (str)
+    DEFAULT = "__eradiate_default__"  #: Documented default value for this field (str)
 
 
 # ------------------------------------------------------------------------------
 #                           Attribute docs extension
 # ------------------------------------------------------------------------------
 
+#: Docstrings are stripped when Python runs with -OO: there is no point in
+#: formatting them
+_DOCS_DISABLED = sys.flags.optimize >= 2
+
+#: Mapping of get_doc() field names to metadata keys
+_DOC_FIELD_KEYS = {
+    "doc": MetadataKey.DOC,
+    "type": MetadataKey.TYPE,
+    "default": MetadataKey.DEFAULT,
+}
+
+#: Cache of docstrings formatted by _eradiate_formatter()
+_formatted_docs = {}
 
-@attr.s
+
+@attr.s(slots=True)
 class _FieldDoc:
     """Internal convenience class to store field documentation information."""
 
@@ -80,6 +100,23 @@ def _eradiate_formatter(cls_doc, field_docs):
     if not field_docs:
         return cls_doc
 
+    # Classes often share their docstring and field docs (e.g. undocumented
+    # subclasses): reuse previously formatted docstrings
+    key = (
+        cls_doc,
+        tuple((name, fd.doc, fd.type, fd.default) for name, fd in field_docs.items()),
+    )
+    try:
+        return _formatted_docs[key]
+    except KeyError:
+        pass
+
+    result = _format_docs(cls_doc, field_docs)
+    _formatted_docs[key] = result
+    return result
+
+
+def _format_docs(cls_doc, field_docs):
     docstrings = []
 
     # Create docstring entry for each documented field
@@ -132,10 +169,23 @@ def parse_docs(cls):
     Returns → class:
         Updated class.
     """
+    # Do nothing if this class was already processed: its docstring is
+    # up-to-date
+    if "__eradiate_field_docs__" in cls.__dict__:
+        return cls
+
     formatter = _eradiate_formatter
 
     docs = {}
+    field_docs = {}
     for field in cls.__attrs_attrs__:
+        # Store documentation metadata for fast lookup by get_doc()
+        field_docs[field.name] = {
+            "doc": field.metadata.get(MetadataKey.DOC),
+            "type": field.metadata.get(MetadataKey.TYPE),
+            "default": field.metadata.get(MetadataKey.DEFAULT),
+        }
+
         if MetadataKey.DOC in field.metadata:
             # Collect field docstring
             docs[field.name] = _FieldDoc(doc=field.metadata[MetadataKey.DOC])
@@ -151,7 +201,9 @@ def parse_docs(cls):
                 docs[field.name].default = field.metadata[MetadataKey.DEFAULT]
 
     # Update docstring
-    cls.__doc__ = formatter(cls.__doc__, docs)
+    if not _DOCS_DISABLED:
+        cls.__doc__ = formatter(cls.__doc__, docs)
+    cls.__eradiate_field_docs__ = field_docs
 
     return cls
 
@@ -174,14 +226,19 @@ def documented(attrib, doc=None, type=None, default=None):
     Returns → ``attrs`` attribute:
         ``attrib``, with metadata updated with documentation contents.
     """
+    if doc is None and type is None and default is None:
+        return attrib
+
+    metadata = attrib.metadata
+
     if doc is not None:
-        attrib.metadata[MetadataKey.DOC] = doc
+        metadata[MetadataKey.DOC] = doc
 
     if type is not None:
-        attrib.metadata[MetadataKey.TYPE] = type
+        metadata[MetadataKey.TYPE] = type
 
     if default is not None:
-        attrib.metadata[MetadataKey.DEFAULT] = default
+        metadata[MetadataKey.DEFAULT] = default
 
     return attrib
 
@@ -209,18 +266,29 @@ def get_doc(cls, attrib, field):
     Raises → ValueError:
         If the requested ``field`` is unsupported.
     """
-    try:
-        if field == "doc":
-            return attr.fields_dict(cls)[attrib].metadata[MetadataKey.DOC]
+    if field not in _DOC_FIELD_KEYS:
+        raise ValueError(f"unsupported attribute doc field {field}")
+
+    # Classes processed by parse_docs() carry a pre-built lookup table
+    # (not inherited: subclasses may redefine fields)
+    field_docs = cls.__dict__.get("__eradiate_field_docs__")
+
+    if field_docs is not None:
+        try:
+            value = field_docs[attrib][field]
+        except KeyError:
+            value = None
+
+        if value is None:
+            raise ValueError(
+                f"{cls.__name__}.{attrib} has no documented field " f"'{field}'"
+            )
 
-        if field == "type":
-            return attr.fields_dict(cls)[attrib].metadata[MetadataKey.TYPE]
+        return value
 
-        if field == "default":
-            return attr.fields_dict(cls)[attrib].metadata[MetadataKey.DEFAULT]
+    try:
+        return attr.fields_dict(cls)[attrib].metadata[_DOC_FIELD_KEYS[field]]
     except KeyError:
         raise ValueError(
             f"{cls.__name__}.{attrib} has no documented field " f"'{field}'"
         )
-
-    raise ValueError(f"unsupported attribute doc field {field}")
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 import eradiate
@@ -73,9 +75,10 @@ def pytest_runtest_setup(item):
 
 
 def pytest_configure(config):
-    markexpr = config.getoption("markexpr", "False")
+    markexpr = config.getoption("markexpr", "") or ""
 
-    if not "not slow" in markexpr:
+    # Only show the banner in interactive sessions: it is noise in piped logs
+    if "not slow" not in markexpr and sys.stdout.isatty():
         print(
             """\033[93mRunning the full test suite. To skip slow tests, please run "pytest -m 'not slow'"\033[0m"""
         )
@@ -15,7 +15,7 @@ from .units import unit_registry as ureg
 # -- Spectral contexts ---------------------------------------------------------
 
 
-@attr.s
+@attr.s(slots=True)
 class SpectralContext(ABC):
     """
     Context data structure holding state relevant to the evaluation of spectrally
@@ -101,7 +101,7 @@ class SpectralContext(ABC):
 
 
 @parse_docs
-@attr.s
+@attr.s(slots=True)
 class MonoSpectralContext(SpectralContext):
     """
     Monochromatic spectral context data structure.
@@ -131,7 +131,7 @@ class MonoSpectralContext(SpectralContext):
 
 
 @parse_docs
-@attr.s
+@attr.s(slots=True)
 class KernelDictContext:
     """
     Kernel dictionary evaluation context data structure. This class is used
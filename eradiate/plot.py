@@ -41,7 +41,7 @@ def detect_axes(from_=None):
         return list(from_.axes.flatten())
 
     if isinstance(from_, list):
-        if all([isinstance(x, Axes) for x in from_]):
+        if all(isinstance(x, Axes) for x in from_):
             return from_
 
     raise TypeError("unsupported type")
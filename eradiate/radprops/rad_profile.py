@@ -839,7 +839,10 @@ class AFGL1986RadProfile(RadProfile):
             factors = compute_scaling_factors(
                 ds=thermoprops, concentration=self.concentrations
             )
-            thermoprops = rescale_concentration(ds=thermoprops, factors=factors)
+            # thermoprops is a private data set: it can be rescaled in place
+            thermoprops = rescale_concentration(
+                ds=thermoprops, factors=factors, inplace=True
+            )
 
         return thermoprops
 
@@ -14,6 +14,9 @@ _LOSCHMIDT = ureg.Quantity(
 # Air number density at 101325 Pa and 288.15 K
 _STANDARD_AIR_NUMBER_DENSITY = _LOSCHMIDT * (273.15 / 288.15)
 
+# Air number density at 101325 Pa and 288.15 K [m^-3], unit-stripped
+_STANDARD_AIR_NUMBER_DENSITY_M3 = _STANDARD_AIR_NUMBER_DENSITY.m_as("m^-3")
+
 
 def kf(ratio=0.0279):
     """Compute the King correction factor.
@@ -57,12 +60,17 @@ def compute_sigma_s_air(wavelength=550.,
     :math:`\eta` is the air refractive index and
     :math:`F` is the air King factor.
 
-    Parameter ``wavelength`` (float):
+    Parameter ``wavelength`` (float or array):
         Wavelength [nm].
 
-    Parameter ``number_density`` (float):
+    Parameter ``number_density`` (float or array):
         Number density of the scattering particles [km^-3].
 
+    .. note:: ``wavelength`` and ``number_density`` are broadcast against each
+       other: passing ``wavelength[:, np.newaxis]`` evaluates the scattering
+       coefficient on a (wavelength, number density) grid in a single call
+       instead of looping over wavelengths.
+
     Parameter ``king_factor`` (float):
         King correction factor of the scattering particles [dimensionless].
         Default value is the air effective King factor at 550 nm as given by
@@ -74,15 +82,20 @@ def compute_sigma_s_air(wavelength=550.,
         If this parameter is set, then its value is used to compute the value of
         the corresponding King factor and supersedes ``king_factor``.
 
-    Returns → float:
+    Returns → float or array:
         Scattering coefficient [km^-1].
     """
     if depolarisation_ratio is not None:
         king_factor = kf(depolarisation_ratio)
 
-    refractive_index = air_refractive_index(
-        wavelength=wavelength,
-        number_density=ureg.Quantity(number_density, "km^-3")
+    return _sigma_s_air(wavelength, number_density, king_factor)
+
+
+def _sigma_s_air(wavelength, number_density, king_factor):
+    # Unit-free implementation of compute_sigma_s_air():
+    # wavelength [nm], number_density [km^-3], returns [km^-1]
+    refractive_index = _air_refractive_index(
+        wavelength, number_density * 1e-9  # km^-3 -> m^-3
     )
 
     return \
@@ -93,7 +106,7 @@ def compute_sigma_s_air(wavelength=550.,
 
 @ureg.wraps(ret=None, args=("nanometer", "m^-3"), strict=False)
 def air_refractive_index(wavelength=550.,
-                         number_density=_STANDARD_AIR_NUMBER_DENSITY.to("m^-3").magnitude):
+                         number_density=_STANDARD_AIR_NUMBER_DENSITY_M3):
     """Computes the air refractive index.
 
     The wavelength dependence of the refractive index is computed using equation
@@ -116,16 +129,22 @@ def air_refractive_index(wavelength=550.,
     Returns → float or array:
         Air refractive index value(s).
     """
+    return _air_refractive_index(wavelength, number_density)
+
+
+def _air_refractive_index(wavelength, number_density):
+    # Unit-free implementation of air_refractive_index():
+    # wavelength [nm], number_density [m^-3]
 
     # wavenumber in inverse micrometer
-    sigma = 1 / ureg.Quantity(wavelength, "nm").to("micrometer").magnitude
+    sigma = 1e3 / wavelength
     sigma2 = np.square(sigma)
 
     # refractivity in parts per 1e8
     x = (5791817. / (238.0183 - sigma2)) + 167909. / (57.362 - sigma2)
 
     # number density scaling
-    x *= number_density / _STANDARD_AIR_NUMBER_DENSITY.to("m^-3").magnitude
+    x = x * (number_density / _STANDARD_AIR_NUMBER_DENSITY_M3)
 
     # refractive index
     index = 1 + x * 1e-8
@@ -31,6 +31,26 @@ def test_sigma_s_air_wavelength_dependence():
     assert np.allclose(prod, prod[0], rtol=0.2)
 
 
+def test_sigma_s_air_broadcasting():
+    """Test that wavelength and number density arrays are broadcast against
+    each other and that the result matches per-wavelength evaluation."""
+
+    wavelength = np.array([400., 550., 700.])
+    number_density = _LOSCHMIDT.magnitude * np.array([1., 0.5, 0.1, 0.01])
+    sigma_s = compute_sigma_s_air(
+        wavelength=wavelength[:, np.newaxis],
+        number_density=number_density
+    )
+    assert sigma_s.shape == (3, 4)
+
+    for i, w in enumerate(wavelength):
+        expected = compute_sigma_s_air(
+            wavelength=w,
+            number_density=number_density
+        )
+        assert np.allclose(sigma_s[i], expected)
+
+
 def test_sigma_s_air_optical_thickness():
     """We compute the total optical thickness due to Rayleigh scattering by the
     air in a 100km high atmosphere. We compare the obtained result to the value
@@ -161,6 +161,7 @@ class HeterogeneousAtmosphere(Atmosphere):
     )
 
     _quantities = {"albedo": "albedo", "sigma_t": "collision_coefficient"}
+    _files = {"albedo": "albedo_file", "sigma_t": "sigma_t_file"}
 
     def __attrs_post_init__(self):
         # Prepare cache directory in case we'd need it
@@ -265,10 +266,9 @@ class HeterogeneousAtmosphere(Atmosphere):
                 raise ValueError(f"field {field} is empty, cannot create volume data")
 
             # If file name is not specified, we create one
-            field_fname = getattr(self, f"{field}_file")
+            field_fname = getattr(self, self._files[field])
 
             # We have the data and the filename: we can create the file
-            field_quantity.m_as(uck.get(self._quantities[field]))
             write_binary_grid3d(
                 field_fname,
                 field_quantity.m_as(uck.get(self._quantities[field])),
@@ -221,15 +221,16 @@ class InstancedCanopyElement(SceneElement):
         """
         from mitsuba.core import ScalarTransform4f
 
-        kernel_length = uck.get("length")
+        # Convert all positions at once rather than one instance at a time
+        positions = self.instance_positions.m_as(uck.get("length"))
 
         return {
             f"{self.canopy_element.id}_instance_{i}": {
                 "type": "instance",
                 "group": {"type": "ref", "id": self.canopy_element.id},
-                "to_world": ScalarTransform4f.translate(position.m_as(kernel_length)),
+                "to_world": ScalarTransform4f.translate(position),
             }
-            for i, position in enumerate(self.instance_positions)
+            for i, position in enumerate(positions)
         }
 
     def kernel_dict(self, ctx: Optional[KernelDictContext] = None) -> MutableMapping:
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 import aabbtree
 import attr
@@ -175,6 +176,15 @@ def _leaf_cloud_radii(n_leaves, leaf_radius):
     return np.full((n_leaves,), leaf_radius)
 
 
+@lru_cache(maxsize=None)
+def _public_field_names(cls):
+    """
+    Return the public names (*i.e.* without leading underscore) of the attrs
+    fields of a class. Results are invariant for a given class and are cached.
+    """
+    return tuple(x.name.lstrip("_") for x in attr.fields(cls))
+
+
 @parse_docs
 @attr.s
 class LeafCloudParams:
@@ -224,7 +234,7 @@ class LeafCloudParams:
 
     def update(self):
         try:
-            for field in [x.name.lstrip("_") for x in self.__attrs_attrs__]:
+            for field in _public_field_names(type(self)):
                 self.__getattribute__(field)
         except Exception as e:
             raise Exception(
@@ -42,7 +42,7 @@ def tempfile_leaves():
 
 def test_inversebeta(rng):
     """Unit tests for :func:`_inversebeta`."""
-    assert np.allclose(_inversebeta(1, 1, rng), 0.4178246)
+    assert np.isclose(_inversebeta(1, 1, rng), 0.4178246)
 
 
 def test_leaf_cloud_positions_cuboid(rng):
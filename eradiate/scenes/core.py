@@ -122,10 +122,10 @@ class KernelDict(UserDict):
         """
 
         for element in elements:
-            try:
-                self.update(element.kernel_dict(ctx))
-            except AttributeError:
-                self.update(element)
+            kernel_dict = getattr(element, "kernel_dict", None)
+            # Merge into the wrapped dict directly: UserDict.update() would
+            # go through __setitem__ once per key
+            self.data.update(element if kernel_dict is None else kernel_dict(ctx))
 
     def load(self) -> "mitsuba.render.Scene":
         """
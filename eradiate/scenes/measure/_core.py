@@ -23,7 +23,7 @@ from ...units import unit_registry as ureg
 
 
 @parse_docs
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class SensorInfo:
     """
     Data type to store information about a sensor associated with a measure.
@@ -131,6 +131,10 @@ class MeasureSpectralConfig(ABC):
         return value
 
 
+# Built once: used to convert wavelength values on each assignment
+_ensure_array_on_quantity = converters.on_quantity(ensure_array)
+
+
 @parse_docs
 @attr.s
 class MonoMeasureSpectralConfig(MeasureSpectralConfig):
@@ -143,7 +147,7 @@ class MonoMeasureSpectralConfig(MeasureSpectralConfig):
         pinttr.ib(
             default=ureg.Quantity([550.0], ureg.nm),
             units=ucc.deferred("wavelength"),
-            converter=lambda x: converters.on_quantity(ensure_array)(
+            converter=lambda x: _ensure_array_on_quantity(
                 pinttr.converters.ensure_units(x, ucc.get("wavelength"))
             ),
         ),
@@ -236,8 +240,10 @@ class MeasureResults:
         if not self.raw:
             raise ValueError("no raw results to convert to xarray.Dataset")
 
-        if eradiate.mode().is_monochromatic():
-            spectral_coord_label = eradiate.mode().spectral_coord_label
+        mode = eradiate.mode()
+
+        if mode.is_monochromatic():
+            spectral_coord_label = mode.spectral_coord_label
             spectral_coord_metadata = {
                 "long_name": "wavelength",
                 "units": symbol(ucc.get("wavelength")),
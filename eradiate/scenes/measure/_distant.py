@@ -91,6 +91,11 @@ def _target_point_rectangle_xyz_converter(x):
     )
 
 
+def _to_vec3(x):
+    # Always copy: instances must not share buffers with the caller
+    return np.array(x, dtype=float)
+
+
 @parse_docs
 @attr.s
 class TargetOriginPoint(TargetOrigin):
@@ -215,11 +220,12 @@ class TargetOriginRectangle(TargetOrigin):
         """Return kernel item."""
         from mitsuba.core import ScalarTransform4f
 
-        xmin = self.xmin.m_as(uck.get("length"))
-        xmax = self.xmax.m_as(uck.get("length"))
-        ymin = self.ymin.m_as(uck.get("length"))
-        ymax = self.ymax.m_as(uck.get("length"))
-        z = self.z.m_as(uck.get("length"))
+        kernel_length = uck.get("length")
+        xmin = self.xmin.m_as(kernel_length)
+        xmax = self.xmax.m_as(kernel_length)
+        ymin = self.ymin.m_as(kernel_length)
+        ymax = self.ymax.m_as(kernel_length)
+        z = self.z.m_as(kernel_length)
 
         dx = xmax - xmin
         dy = ymax - ymin
@@ -263,8 +269,9 @@ class TargetOriginSphere(TargetOrigin):
 
     def kernel_item(self):
         """Return kernel item."""
-        center = self.center.m_as(uck.get("length"))
-        radius = self.radius.m_as(uck.get("length"))
+        kernel_length = uck.get("length")
+        center = self.center.m_as(kernel_length)
+        radius = self.radius.m_as(kernel_length)
 
         return {"type": "sphere", "center": center, "radius": radius}
 
@@ -342,6 +349,7 @@ class DistantMeasure(Measure):
             If ``illumination`` has an unsupported type.
         """
         k_irradiance_units = uck.get("irradiance")
+        spectral_coord_label = eradiate.mode().spectral_coord_label
 
         if isinstance(illumination, DirectionalIllumination):
             # Collect illumination angular data
@@ -362,49 +370,39 @@ class DistantMeasure(Measure):
                 "units": symbol("deg"),
             }
 
-            # Collect illumination spectral data
-            irradiances = (
-                np.array(
-                    [
-                        illumination.irradiance.eval(spectral_ctx=spectral_ctx).m_as(
-                            k_irradiance_units
-                        )
-                        for spectral_ctx in self.spectral_cfg.spectral_ctxs()
-                    ]
-                )
-                * k_irradiance_units
+            # Collect illumination spectral data (magnitudes in kernel units)
+            irradiances = np.array(
+                [
+                    illumination.irradiance.eval(spectral_ctx=spectral_ctx).m_as(
+                        k_irradiance_units
+                    )
+                    for spectral_ctx in self.spectral_cfg.spectral_ctxs()
+                ]
             )
-            spectral_coord_label = eradiate.mode().spectral_coord_label
 
             # Add irradiance variable
+            # Irradiance does not depend on film coordinates: it is stored
+            # without (y, x) dimensions and xarray broadcasts it lazily when
+            # it is used as a divisor downstream
             ds["irradiance"] = (
                 ("sza", "saa", spectral_coord_label),
-                np.array(irradiances.magnitude * cos_sza).reshape(
-                    (1, 1, len(irradiances))
-                ),
+                (irradiances * cos_sza).reshape((1, 1, len(irradiances))),
             )
 
         elif isinstance(illumination, ConstantIllumination):
             # Collect illumination spectral data
             k_radiance_units = uck.get("radiance")
-            radiances = (
-                np.array(
-                    [
-                        illumination.radiance.eval(spectral_ctx=spectral_ctx).m_as(
-                            k_radiance_units
-                        )
-                        for spectral_ctx in self.spectral_cfg.spectral_ctxs()
-                    ]
-                )
-                * k_radiance_units
+            radiances = np.array(
+                [
+                    illumination.radiance.eval(spectral_ctx=spectral_ctx).m_as(
+                        k_radiance_units
+                    )
+                    for spectral_ctx in self.spectral_cfg.spectral_ctxs()
+                ]
             )
-            spectral_coord_label = eradiate.mode().spectral_coord_label
 
-            # Add irradiance variable
-            ds["irradiance"] = (
-                (spectral_coord_label,),
-                np.pi * np.array(radiances.magnitude).reshape((len(radiances),)),
-            )
+            # Add irradiance variable (spectral dimension only, see above)
+            ds["irradiance"] = ((spectral_coord_label,), np.pi * radiances)
 
         else:
             raise TypeError(
@@ -472,7 +470,7 @@ class DistantRadianceMeasure(DistantMeasure):
     direction = documented(
         attr.ib(
             default=[0, 0, 1],
-            converter=np.array,
+            converter=_to_vec3,
             validator=validators.is_vector3,
         ),
         doc="A 3-vector orienting the hemisphere mapped by the measure.",
@@ -690,7 +688,7 @@ class DistantFluxMeasure(DistantMeasure):
     direction = documented(
         attr.ib(
             default=[0, 0, 1],
-            converter=np.array,
+            converter=_to_vec3,
             validator=validators.is_vector3,
         ),
         doc="A 3-vector defining the normal to the reference surface for which "
@@ -99,8 +99,9 @@ class PerspectiveCameraMeasure(Measure):
     def _base_dicts(self):
         from mitsuba.core import ScalarTransform4f
 
-        target = self.target.m_as(uck.get("length"))
-        origin = self.origin.m_as(uck.get("length"))
+        kernel_length = uck.get("length")
+        target = self.target.m_as(kernel_length)
+        origin = self.origin.m_as(kernel_length)
         result = []
 
         for sensor_info in self.sensor_infos():
@@ -63,8 +63,9 @@ class RadiancemeterMeasure(Measure):
         return (1, 1)
 
     def _base_dicts(self):
-        target = self.target.m_as(uck.get("length"))
-        origin = self.origin.m_as(uck.get("length"))
+        kernel_length = uck.get("length")
+        target = self.target.m_as(kernel_length)
+        origin = self.origin.m_as(kernel_length)
         direction = target - origin
         result = []
 
@@ -66,8 +66,11 @@ class RadiancemeterArrayMeasure(Measure):
         return (self.origins.shape[0], 1)
 
     def _base_dicts(self):
-        origins = self.origins.m_as(uck.get("length"))
-        directions = self.directions
+        # Serialised arrays are identical for all sensors: build them once
+        origins = ", ".join(
+            map(str, self.origins.m_as(uck.get("length")).ravel(order="C"))
+        )
+        directions = ", ".join(map(str, self.directions.ravel(order="C")))
         result = []
 
         for sensor_info in self.sensor_infos():
@@ -75,10 +78,8 @@ class RadiancemeterArrayMeasure(Measure):
                 {
                     "type": "radiancemeterarray",
                     "id": sensor_info.id,
-                    "origins": ", ".join([str(x) for x in origins.ravel(order="C")]),
-                    "directions": ", ".join(
-                        [str(x) for x in directions.ravel(order="C")]
-                    ),
+                    "origins": origins,
+                    "directions": directions,
                 }
             )
 
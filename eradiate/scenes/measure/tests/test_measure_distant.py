@@ -149,11 +149,11 @@ def test_distant_radiance_postprocessing(mode_mono):
     # Postprocessing succeeds and viewing angles have correct bounds
     ds = d.postprocess()
     assert "vza" in ds.coords
-    assert np.allclose(ds.vza.min(), 5.06592926)  # Value calculated manually
-    assert np.allclose(ds.vza.max(), 86.47273911)  # Value calculated manually
+    assert np.isclose(ds.vza.min().item(), 5.06592926)  # Value calculated manually
+    assert np.isclose(ds.vza.max().item(), 86.47273911)  # Value calculated manually
     assert "vaa" in ds.coords
-    assert np.allclose(ds.vaa.min(), -177.09677419)  # Value calculated manually
-    assert np.allclose(ds.vaa.max(), 177.09677419)  # Value calculated manually
+    assert np.isclose(ds.vaa.min().item(), -177.09677419)  # Value calculated manually
+    assert np.isclose(ds.vaa.max().item(), 177.09677419)  # Value calculated manually
 
     # We now move on to the plane case
     d._film_resolution = (32, 1)
@@ -167,8 +167,8 @@ def test_distant_radiance_postprocessing(mode_mono):
     }
     ds = d.postprocess()
     assert "vza" in ds.coords
-    assert np.allclose(ds.vza.min(), -87.1875)  # Value manually calculated
-    assert np.allclose(ds.vza.max(), 87.1875)  # Value manually calculated
+    assert np.isclose(ds.vza.min().item(), -87.1875)  # Value manually calculated
+    assert np.isclose(ds.vza.max().item(), 87.1875)  # Value manually calculated
     assert "vaa" in ds.coords
     assert np.allclose(ds.vaa, 0.0)
 
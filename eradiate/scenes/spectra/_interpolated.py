@@ -8,11 +8,12 @@ import pinttr
 import eradiate
 
 from ._core import Spectrum, SpectrumFactory
-from ... import converters, validators
+from ... import converters
 from ..._util import ensure_array
 from ...attrs import documented, parse_docs
 from ...contexts import KernelDictContext, SpectralContext
 from ...exceptions import UnsupportedModeError
+from ...units import units_compatible
 from ...units import unit_context_config as ucc
 from ...units import unit_context_kernel as uck
 
@@ -48,7 +49,7 @@ class InterpolatedSpectrum(Spectrum):
         if self.quantity is not None and isinstance(value, pint.Quantity):
             expected_units = ucc.get(self.quantity)
 
-            if not pinttr.util.units_compatible(expected_units, value.units):
+            if not units_compatible(expected_units, value.units):
                 raise pinttr.exceptions.UnitsError(
                     value.units,
                     expected_units,
@@ -60,10 +61,17 @@ class InterpolatedSpectrum(Spectrum):
     @values.validator
     @wavelengths.validator
     def _values_wavelengths_validator(self, attribute, value):
-        # Check that attribute is an array
-        validators.on_quantity(attr.validators.instance_of(np.ndarray))(
-            self, attribute, value
-        )
+        # Check that attribute is an array (direct check: this validator runs
+        # for both fields upon each initialisation)
+        if isinstance(value, pint.Quantity):
+            magnitude = value.magnitude
+        else:
+            magnitude = value
+        if not isinstance(magnitude, np.ndarray):
+            raise TypeError(
+                f"'{attribute.name}' must be {np.ndarray!r} "
+                f"(got {magnitude!r} that is a {magnitude.__class__!r})"
+            )
 
         # Check size
         if value.ndim > 1:
@@ -10,6 +10,7 @@ from ... import validators
 from ...attrs import documented, parse_docs
 from ...contexts import KernelDictContext, SpectralContext
 from ...scenes.spectra import Spectrum, SpectrumFactory
+from ...units import units_compatible
 
 
 @SpectrumFactory.register("uniform")
@@ -35,7 +36,7 @@ class UniformSpectrum(Spectrum):
         if self.quantity is not None and isinstance(value, pint.Quantity):
             expected_units = ucc.get(self.quantity)
 
-            if not pinttr.util.units_compatible(expected_units, value.units):
+            if not units_compatible(expected_units, value.units):
                 raise pinttr.exceptions.UnitsError(
                     value.units,
                     expected_units,
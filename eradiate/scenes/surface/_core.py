@@ -17,6 +17,36 @@ from ...units import unit_context_kernel as uck
 from ...units import unit_registry as ureg
 
 
+def _length_converter(value):
+    # Quantities are passed through as is (like pinttr's to_units converter)
+    # without resolving the deferred config length unit
+    if isinstance(value, pint.Quantity):
+        return value
+    return value * ucc.get("length")
+
+
+def _rectangle_to_world(w: float, z: float):
+    """
+    Build the transform mapping the kernel's rectangle shape to a square
+    surface of width ``w`` at altitude ``z`` (in kernel units).
+    """
+    from mitsuba.core import ScalarTransform4f
+
+    # Equivalent to translate([0, 0, z]) * scale([w / 2, w / 2, 1])
+    return ScalarTransform4f(
+        [
+            [0.5 * w, 0.0, 0.0, 0.0],
+            [0.0, 0.5 * w, 0.0, 0.0],
+            [0.0, 0.0, 1.0, z],
+            [0.0, 0.0, 0.0, 1.0],
+        ]
+    )
+
+
+#: Kernel width used when width is set to AUTO and no override is requested
+_DEFAULT_KERNEL_WIDTH = ureg.Quantity(100.0, "km")
+
+
 @parse_docs
 @attr.s
 class Surface(SceneElement, ABC):
@@ -39,7 +69,7 @@ class Surface(SceneElement, ABC):
         pinttr.ib(
             default=ureg.Quantity(0.0, "km"),
             units=ucc.deferred("length"),
-            converter=pinttr.converters.to_units(ucc.deferred("length")),
+            converter=_length_converter,
             validator=[validators.is_positive, pinttr.validators.has_compatible_units],
         ),
         doc="Surface geopotential altitude (referenced to Earth's mean sea level).",
@@ -50,9 +80,7 @@ class Surface(SceneElement, ABC):
     width: Union[pint.Quantity, _Auto] = documented(
         pinttr.ib(
             default=AUTO,
-            converter=converters.auto_or(
-                pinttr.converters.to_units(ucc.deferred("length"))
-            ),
+            converter=converters.auto_or(_length_converter),
             validator=[
                 validators.auto_or(validators.is_positive),
                 validators.auto_or(pinttr.validators.has_compatible_units),
@@ -97,27 +125,36 @@ class Surface(SceneElement, ABC):
             :class:`~eradiate.scenes.core.KernelDict` containing all the shapes
             attached to the surface.
         """
-        from mitsuba.core import ScalarTransform4f, ScalarVector3f
+        return {f"shape_{self.id}": self._shape(ctx, f"bsdf_{self.id}")}
 
+    def _shape(self, ctx: KernelDictContext, bsdf_id: str) -> Dict:
+        """
+        Return the shape plugin specification (without its key) referencing
+        or embedding the BSDF with identifier ``bsdf_id``.
+        """
         if ctx.ref:
-            bsdf = {"type": "ref", "id": f"bsdf_{self.id}"}
+            bsdf = {"type": "ref", "id": bsdf_id}
         else:
-            bsdf = self.bsdfs()[f"bsdf_{self.id}"]
-
-        w = self.kernel_width(ctx=ctx).m_as(uck.get("length"))
-        z = self.altitude.m_as(uck.get("length"))
-        translate_trafo = ScalarTransform4f.translate(ScalarVector3f(0.0, 0.0, z))
-        scale_trafo = ScalarTransform4f.scale(ScalarVector3f(w / 2.0, w / 2.0, 1.0))
-        trafo = translate_trafo * scale_trafo
+            bsdf = self.bsdfs(ctx)[bsdf_id]
 
         return {
-            f"shape_{self.id}": {
-                "type": "rectangle",
-                "to_world": trafo,
-                "bsdf": bsdf,
-            }
+            "type": "rectangle",
+            "to_world": self._to_world(ctx),
+            "bsdf": bsdf,
         }
 
+    def _to_world(self, ctx: KernelDictContext = None):
+        """
+        Return the transform mapping the kernel's rectangle shape to the
+        surface.
+        """
+        # Kernel units may be overridden at runtime: resolve them once per call
+        kernel_length = uck.get("length")
+        w = self.kernel_width(ctx=ctx).m_as(kernel_length)
+        z = self.altitude.m_as(kernel_length)
+
+        return _rectangle_to_world(w, z)
+
     def kernel_width(self, ctx: KernelDictContext = None):
         """
         Return width of kernel object, possibly overridden by
@@ -138,16 +175,21 @@ class Surface(SceneElement, ABC):
             if self.width is not AUTO:
                 return self.width
             else:
-                return 100.0 * ureg.km
+                return _DEFAULT_KERNEL_WIDTH
 
     def kernel_dict(self, ctx: KernelDictContext = None) -> Dict:
         kernel_dict = {}
 
-        if not ctx.ref:
-            kernel_dict[self.id] = self.shapes(ctx)[f"shape_{self.id}"]
-        else:
-            kernel_dict[f"bsdf_{self.id}"] = self.bsdfs(ctx)[f"bsdf_{self.id}"]
-            kernel_dict[self.id] = self.shapes(ctx)[f"shape_{self.id}"]
+        # Identifiers are built once per call (self.id is mutable: they are not
+        # cached across calls)
+        bsdf_id = f"bsdf_{self.id}"
+
+        # In reference mode, _shape() only emits a reference to the BSDF:
+        # the BSDF is built once here and never by _shape()
+        if ctx.ref:
+            kernel_dict[bsdf_id] = self.bsdfs(ctx)[bsdf_id]
+
+        kernel_dict[self.id] = self._shape(ctx, bsdf_id)
 
         return kernel_dict
 
@@ -167,7 +209,8 @@ class Surface(SceneElement, ABC):
             )
             new_width = self.width
         else:
-            new_width = self.width * factor
+            # Scale magnitude and reattach units: skips Pint's arithmetic path
+            new_width = ureg.Quantity(self.width.magnitude * factor, self.width.units)
 
         return attr.evolve(self, width=new_width)
 
@@ -6,7 +6,6 @@ from typing import Optional
 
 import attr
 import pinttr
-from matplotlib import pyplot as plt
 from tqdm.auto import tqdm
 
 import eradiate
@@ -214,6 +213,9 @@ class SolverApp(ABC):
             Filename prefix for plot files. A plot file is create for each
             computed quantity of each measure.
         """
+        # Imported here to avoid loading matplotlib when importing Eradiate
+        from matplotlib import pyplot as plt
+
         for measure in self.scene.measures:
             measure_id = measure.id
             result = self._results[measure_id]
@@ -1,20 +1,76 @@
 import os
+from functools import lru_cache
+from pathlib import Path
 
-import matplotlib.pyplot as plt
 import numpy as np
+import pytest
 
 import eradiate
+from eradiate import unit_registry as ureg
+from eradiate.scenes.spectra import InterpolatedSpectrum
 
 eradiate_dir = eradiate.config.dir
 output_dir = os.path.join(eradiate_dir, "test_report", "generated")
 
 
+@lru_cache(maxsize=None)
 def ensure_output_dir(path):
-    if not os.path.isdir(path):
-        os.makedirs(path)
+    # Safe if several test processes create the directory concurrently;
+    # cached so that the file system is only queried once per path
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
+@pytest.fixture(scope="module")
+def reflectance():
+    # Surface reflectance spectrum, built once and shared by all cases
+    return InterpolatedSpectrum(
+        quantity="reflectance",
+        wavelengths=ureg.Quantity([500.0, 700.0], "nm"),
+        values=[0.0, 1.0],
+    )
+
+
+@pytest.fixture(
+    scope="module",
+    params=[
+        "onedim_directional",
+        "onedim_constant",
+        "rami_directional",
+        "rami_constant",
+    ],
+)
+def albedo_case(request, reflectance):
+    # Module-scoped: only mode-independent scene specifications are built here,
+    # apps are instantiated in the test once the mode is set
+    case_name = request.param
+    solver, illumination_type = case_name.split("_")
+
+    # All cases share the same measure and surface specifications
+    scene = {
+        "measures": [
+            {
+                "type": "distant_albedo",
+                "spectral_cfg": {"wavelengths": [500.0, 550.0, 600.0, 650.0, 700.0]},
+                "film_resolution": (64, 64),
+                "spp": 100,
+            }
+        ],
+        "surface": {"type": "lambertian", "reflectance": reflectance},
+        "illumination": {
+            "directional": {"type": "directional", "zenith": 0.0},
+            "constant": {"type": "constant"},
+        }[illumination_type],
+    }
+
+    if solver == "onedim":
+        scene["atmosphere"] = None
+    else:
+        scene["canopy"] = None
 
+    return case_name, solver, scene
 
-def test_albedo(mode_mono):
+
+def test_albedo(mode_mono, albedo_case):
     """
     Albedo
     ======
@@ -61,145 +117,56 @@ def test_albedo(mode_mono):
        :width: 100%
 
     """
-    apps = {
-        "onedim_directional": eradiate.solvers.onedim.OneDimSolverApp(
-            scene={
-                "measures": [
-                    {
-                        "type": "distant_albedo",
-                        "spectral_cfg": {
-                            "wavelengths": [500.0, 550.0, 600.0, 650.0, 700.0]
-                        },
-                        "film_resolution": (64, 64),
-                        "spp": 100,
-                    }
-                ],
-                "atmosphere": None,
-                "surface": {
-                    "type": "lambertian",
-                    "reflectance": {
-                        "type": "interpolated",
-                        "wavelengths": [500.0, 700.0],
-                        "values": [0.0, 1.0],
-                    },
-                },
-                "illumination": {"type": "directional", "zenith": 0.0},
-            }
-        ),
-        "onedim_constant": eradiate.solvers.onedim.OneDimSolverApp(
-            scene={
-                "measures": [
-                    {
-                        "type": "distant_albedo",
-                        "spectral_cfg": {
-                            "wavelengths": [500.0, 550.0, 600.0, 650.0, 700.0]
-                        },
-                        "film_resolution": (64, 64),
-                        "spp": 100,
-                    }
-                ],
-                "atmosphere": None,
-                "surface": {
-                    "type": "lambertian",
-                    "reflectance": {
-                        "type": "interpolated",
-                        "wavelengths": [500.0, 700.0],
-                        "values": [0.0, 1.0],
-                    },
-                },
-                "illumination": {"type": "constant"},
-            }
-        ),
-        "rami_directional": eradiate.solvers.rami.RamiSolverApp(
-            scene={
-                "measures": [
-                    {
-                        "type": "distant_albedo",
-                        "spectral_cfg": {
-                            "wavelengths": [500.0, 550.0, 600.0, 650.0, 700.0]
-                        },
-                        "film_resolution": (64, 64),
-                        "spp": 100,
-                    }
-                ],
-                "canopy": None,
-                "surface": {
-                    "type": "lambertian",
-                    "reflectance": {
-                        "type": "interpolated",
-                        "wavelengths": [500.0, 700.0],
-                        "values": [0.0, 1.0],
-                    },
-                },
-                "illumination": {"type": "directional", "zenith": 0.0},
-            }
-        ),
-        "rami_constant": eradiate.solvers.rami.RamiSolverApp(
-            scene={
-                "measures": [
-                    {
-                        "type": "distant_albedo",
-                        "spectral_cfg": {
-                            "wavelengths": [500.0, 550.0, 600.0, 650.0, 700.0]
-                        },
-                        "film_resolution": (64, 64),
-                        "spp": 100,
-                    }
-                ],
-                "canopy": None,
-                "surface": {
-                    "type": "lambertian",
-                    "reflectance": {
-                        "type": "interpolated",
-                        "wavelengths": [500.0, 700.0],
-                        "values": [0.0, 1.0],
-                    },
-                },
-                "illumination": {"type": "directional", "zenith": 0.0},
-            }
-        ),
-    }
-
-    for app_name, app in apps.items():
-        # Run simulation
-        app.run()
-        results = app.results["measure"]
-
-        # Plot results
-        fig, [ax1, ax2] = plt.subplots(1, 2, figsize=(10, 5))
-        wavelengths = results["albedo"].w.values
-        albedos = results["albedo"].values.squeeze()
-        expected = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
-
-        ax1.plot(wavelengths, albedos, linestyle="--", marker="o")
-        ax1.set_title("Albedo")
-        ax1.set_xlabel("Wavelength [nm]")
-
-        rdiffs = (albedos - expected) / expected
-        ax2.plot(wavelengths, rdiffs, linestyle="--", marker="o")
-        ax2.set_title("Relative difference")
-        ax2.set_xlabel("Wavelength [nm]")
-        rdiffs_max = np.max(np.abs(rdiffs[~np.isnan(rdiffs)]))
-        exp = np.ceil(np.log10(rdiffs_max))
-        ax2.set_xlim(ax1.get_xlim())
-        ax2.set_ylim([-(10 ** exp), 10 ** exp])
-        ax2.yaxis.set_label_position("right")
-        ax2.yaxis.tick_right()
-        ax2.ticklabel_format(axis="y", style="sci", scilimits=[-3, 3])
-        # Hide offset label and add it as axis label
-        if abs(exp) >= 3:
-            ax2.yaxis.offsetText.set_visible(False)
-            ax2.yaxis.set_label_text(f"×$10^{{{int(exp)}}}$")
-
-        plt.suptitle(f"Case: {app_name}")
-        plt.tight_layout()
-
-        filename = f"albedo_{app_name}.png"
-        ensure_output_dir(os.path.join(output_dir, "plots"))
-        fname_plot = os.path.join(output_dir, "plots", filename)
-
-        fig.savefig(fname_plot, dpi=200)
-        plt.close()
-
-        # Check results
-        assert np.allclose(results["albedo"].values, expected, atol=1e-3)
+    app_name, solver, scene = albedo_case
+
+    if solver == "onedim":
+        app = eradiate.solvers.onedim.OneDimSolverApp(scene=scene)
+    else:
+        app = eradiate.solvers.rami.RamiSolverApp(scene=scene)
+
+    # Run simulation
+    app.run()
+    results = app.results["measure"]
+
+    # Plot results
+    from matplotlib.figure import Figure
+
+    # The pyplot state machine (and interactive backend setup) is not needed
+    # to write figures to files
+    fig = Figure(figsize=(10, 5))
+    ax1, ax2 = fig.subplots(1, 2)
+    wavelengths = results["albedo"].w.values
+    albedos = results["albedo"].values.squeeze()
+    expected = np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+
+    ax1.plot(wavelengths, albedos, linestyle="--", marker="o")
+    ax1.set_title("Albedo")
+    ax1.set_xlabel("Wavelength [nm]")
+
+    rdiffs = (albedos - expected) / expected
+    ax2.plot(wavelengths, rdiffs, linestyle="--", marker="o")
+    ax2.set_title("Relative difference")
+    ax2.set_xlabel("Wavelength [nm]")
+    rdiffs_max = np.max(np.abs(rdiffs[~np.isnan(rdiffs)]))
+    exp = np.ceil(np.log10(rdiffs_max))
+    ax2.set_xlim(ax1.get_xlim())
+    ax2.set_ylim([-(10 ** exp), 10 ** exp])
+    ax2.yaxis.set_label_position("right")
+    ax2.yaxis.tick_right()
+    ax2.ticklabel_format(axis="y", style="sci", scilimits=[-3, 3])
+    # Hide offset label and add it as axis label
+    if abs(exp) >= 3:
+        ax2.yaxis.offsetText.set_visible(False)
+        ax2.yaxis.set_label_text(f"×$10^{{{int(exp)}}}$")
+
+    fig.suptitle(f"Case: {app_name}")
+    fig.tight_layout()
+
+    filename = f"albedo_{app_name}.png"
+    ensure_output_dir(os.path.join(output_dir, "plots"))
+    fname_plot = os.path.join(output_dir, "plots", filename)
+
+    fig.savefig(fname_plot, dpi=200)
+
+    # Check results
+    assert np.allclose(results["albedo"].values, expected, atol=1e-3)
@@ -6,6 +6,10 @@ import pytest
 from eradiate.scenes.core import KernelDict
 from eradiate.solvers.core import runner
 
+# Scene parameters shared by all test cases
+VZA = np.linspace(0, 80, 10)
+RHO = 0.5
+
 
 @pytest.mark.parametrize("illumination,spp", [("directional", 1), ("constant", 256000)])
 @pytest.mark.parametrize("li", [0.1, 1.0, 10.0])
@@ -46,9 +50,6 @@ def test_radiometric_accuracy(mode_mono, illumination, spp, li):
     """
 
     # Basic configuration
-    vza = np.linspace(0, 80, 10)
-    rho = 0.5
-
     kernel_dict = KernelDict.new(
         {
             "type": "scene",
@@ -56,7 +57,7 @@ def test_radiometric_accuracy(mode_mono, illumination, spp, li):
                 "type": "rectangle",
                 "bsdf": {
                     "type": "diffuse",
-                    "reflectance": rho,
+                    "reflectance": RHO,
                 },
             },
             "measure": {
@@ -66,7 +67,7 @@ def test_radiometric_accuracy(mode_mono, illumination, spp, li):
                 "sampler": {"type": "independent", "sample_count": spp},
                 "film": {
                     "type": "hdrfilm",
-                    "width": len(vza),
+                    "width": len(VZA),
                     "height": 1,
                     "pixel_format": "luminance",
                     "component_format": "float32",
@@ -83,14 +84,14 @@ def test_radiometric_accuracy(mode_mono, illumination, spp, li):
             "direction": [0, 0, -1],
             "irradiance": {"type": "uniform", "value": li},
         }
-        theoretical_solution = np.full_like(vza, rho * li / np.pi)
+        theoretical_solution = np.full_like(VZA, RHO * li / np.pi)
 
     elif illumination == "constant":
         kernel_dict["illumination"] = {
             "type": "constant",
             "radiance": {"type": "uniform", "value": li},
         }
-        theoretical_solution = np.full_like(vza, rho * li)
+        theoretical_solution = np.full_like(VZA, RHO * li)
 
     else:
         raise ValueError(f"unsupported illumination '{illumination}'")
@@ -2,13 +2,11 @@
 
 import os
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 
 import eradiate
 from eradiate import unit_registry as ureg
-from eradiate.plot import remove_xylabels
 
 eradiate_dir = os.environ["ERADIATE_DIR"]
 output_dir = os.path.join(eradiate_dir, "test_report", "generated")
@@ -67,6 +65,10 @@ def test_symmetry_zenith(mode_mono_double, surface, atmosphere):
     .. image:: generated/plots/rpv_homogeneous.png
        :width: 45%
     """
+    import matplotlib.pyplot as plt
+
+    from eradiate.plot import remove_xylabels
+
     spp = int(1e6)
     n_vza = 17
 
@@ -1,9 +1,9 @@
 import os
 from copy import copy
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+import pytest
 
 import eradiate
 from eradiate import unit_registry as ureg
@@ -17,6 +17,7 @@ def ensure_output_dir(path):
         os.makedirs(path)
 
 
+@pytest.mark.slow
 def test_spp_splitting(mode_mono):
     """
     SPP splitting test
@@ -52,6 +53,8 @@ def test_spp_splitting(mode_mono):
     .. image:: generated/plots/test_spp_splitting.png
        :width: 66%
     """
+    import matplotlib.pyplot as plt
+
     surface = eradiate.scenes.surface.LambertianSurface(
         width=1.0 * ureg.m, reflectance=1.0
     )
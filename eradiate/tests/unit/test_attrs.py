@@ -0,0 +1,49 @@
+import attr
+import pytest
+
+from eradiate.attrs import documented, get_doc, parse_docs
+
+
+def test_get_doc():
+    @parse_docs
+    @attr.s
+    class Parent:
+        field = documented(
+            attr.ib(default=None), doc="Some field.", type="int", default="None"
+        )
+        undocumented = attr.ib(default=None)
+
+    @attr.s
+    class Child(Parent):  # Not processed by parse_docs
+        pass
+
+    for cls in [Parent, Child]:
+        assert get_doc(cls, "field", "doc") == "Some field."
+        assert get_doc(cls, "field", "type") == "int"
+        assert get_doc(cls, "field", "default") == "None"
+
+        # Missing documentation or attribute raise
+        with pytest.raises(ValueError):
+            get_doc(cls, "undocumented", "doc")
+        with pytest.raises(ValueError):
+            get_doc(cls, "missing", "doc")
+
+        # Unsupported doc fields raise
+        with pytest.raises(ValueError):
+            get_doc(cls, "field", "foo")
+
+
+def test_parse_docs():
+    @attr.s
+    class Cls:
+        """Class docstring."""
+
+        field = documented(attr.ib(default=None), doc="Some field.", type="int")
+
+    parse_docs(Cls)
+    doc = Cls.__doc__
+    assert "``field``: int\n    Some field." in doc
+
+    # Processing a class twice leaves its docstring unchanged
+    parse_docs(Cls)
+    assert Cls.__doc__ == doc
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from eradiate import unit_registry as ureg
@@ -8,12 +10,44 @@ from eradiate.frame import (
     spherical_to_cartesian,
 )
 
+# Reference values used in expected results (computed once, exact to machine
+# precision)
+SQRT3_2 = 0.5 * math.sqrt(3.0)
+COS_PI_4 = 0.5 * math.sqrt(2.0)
+
+# Angle pairs (zenith, azimuth) [rad] and corresponding directions, used to
+# check vectorised conversions
+ANGLES = np.array(
+    [
+        [0.0, 0.0],
+        [math.pi, 0.0],
+        [0.5 * math.pi, 0.0],
+        [0.5 * math.pi, math.pi],
+        [0.5 * math.pi, 0.5 * math.pi],
+        [0.5 * math.pi, -0.5 * math.pi],
+        [0.25 * math.pi, 0.0],
+        [0.5 * math.pi, 0.25 * math.pi],
+    ]
+)
+DIRECTIONS = np.array(
+    [
+        [0.0, 0.0, 1.0],
+        [0.0, 0.0, -1.0],
+        [1.0, 0.0, 0.0],
+        [-1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.0, -1.0, 0.0],
+        [COS_PI_4, 0.0, COS_PI_4],
+        [COS_PI_4, COS_PI_4, 0.0],
+    ]
+)
+
 
 def test_cos_angle_to_direction():
     # Old-style call
     assert np.allclose(cos_angle_to_direction(1.0, 0.0), [0, 0, 1])
     assert np.allclose(cos_angle_to_direction(0.0, 0.0), [1, 0, 0])
-    assert np.allclose(cos_angle_to_direction(0.5, 0.0), [np.sqrt(3) / 2, 0, 0.5])
+    assert np.allclose(cos_angle_to_direction(0.5, 0.0), [SQRT3_2, 0, 0.5])
     assert np.allclose(
         cos_angle_to_direction(-1.0, ureg.Quantity(135.0, "deg")), [0, 0, -1]
     )
@@ -21,7 +55,7 @@ def test_cos_angle_to_direction():
     # Vectorised call
     assert np.allclose(
         cos_angle_to_direction([1.0, 0.0, 0.5, -1.0], [0, 0, 0.0, 0.75 * np.pi]),
-        ([0, 0, 1], [1, 0, 0], [np.sqrt(3) / 2, 0, 0.5], [0, 0, -1]),
+        ([0, 0, 1], [1, 0, 0], [SQRT3_2, 0, 0.5], [0, 0, -1]),
     )
 
 
@@ -33,45 +67,20 @@ def test_angles_to_direction():
     assert np.allclose(angles_to_direction([0.5 * np.pi, np.pi]), [-1, 0, 0])
     assert np.allclose(angles_to_direction([0.5 * np.pi, 0.5 * np.pi]), [0, 1, 0])
     assert np.allclose(angles_to_direction([0.5 * np.pi, -0.5 * np.pi]), [0, -1, 0])
+    assert np.allclose(angles_to_direction([0.25 * np.pi, 0]), [COS_PI_4, 0, COS_PI_4])
     assert np.allclose(
-        angles_to_direction([0.25 * np.pi, 0]), [0.70710678, 0, 0.70710678]
-    )
-    assert np.allclose(
-        angles_to_direction([0.5 * np.pi, 0.25 * np.pi]), [0.70710678, 0.70710678, 0]
+        angles_to_direction([0.5 * np.pi, 0.25 * np.pi]), [COS_PI_4, COS_PI_4, 0]
     )
 
     # Vectorised call
-    assert np.allclose(
-        angles_to_direction(
-            [
-                [0.0, 0.0],
-                [np.pi, 0.0],
-                [0.5 * np.pi, 0.0],
-                [0.5 * np.pi, np.pi],
-                [0.5 * np.pi, 0.5 * np.pi],
-                [0.5 * np.pi, -0.5 * np.pi],
-                [0.25 * np.pi, 0],
-                [0.5 * np.pi, 0.25 * np.pi],
-            ]
-        ),
-        [
-            [0, 0, 1],
-            [0, 0, -1],
-            [1, 0, 0],
-            [-1, 0, 0],
-            [0, 1, 0],
-            [0, -1, 0],
-            [0.70710678, 0, 0.70710678],
-            [0.70710678, 0.70710678, 0],
-        ],
-    )
+    np.testing.assert_allclose(angles_to_direction(ANGLES), DIRECTIONS, atol=1e-12)
 
 
 def test_direction_to_angles():
     # Old-style call
     assert np.allclose(direction_to_angles([0, 0, 1]), (0, 0))
     assert np.allclose(
-        direction_to_angles([np.sqrt(2) / 2, np.sqrt(2) / 2, 0]).m_as("deg"),
+        direction_to_angles([COS_PI_4, COS_PI_4, 0]).m_as("deg"),
         [90.0, 45.0],
     )
 
@@ -84,13 +93,13 @@ def test_direction_to_angles():
 
 def test_spherical_to_cartesian():
     r = 2.0
-    theta = np.deg2rad(30)
-    phi = np.deg2rad(0)
+    theta = math.radians(30.0)
+    phi = 0.0
     d = spherical_to_cartesian(r, theta, phi)
-    assert np.allclose(d, [1, 0, np.sqrt(3)])
+    assert np.allclose(d, [1, 0, math.sqrt(3.0)])
 
     r = ureg.Quantity(2.0, "km")
-    theta = np.deg2rad(60)
-    phi = np.deg2rad(30)
+    theta = math.radians(60.0)
+    phi = math.radians(30.0)
     d = spherical_to_cartesian(r, theta, phi)
-    assert np.allclose(d, ureg.Quantity([3.0 / 2.0, np.sqrt(3) / 2.0, 1.0], "km"))
+    assert np.allclose(d, ureg.Quantity([3.0 / 2.0, SQRT3_2, 1.0], "km"))
@@ -22,3 +22,9 @@ def test_modes():
     assert mitsuba.variant() == "scalar_mono"
     assert eradiate.mode().is_monochromatic()
     assert eradiate.mode().is_single_precision()
+
+    # Selecting the active mode again is a no-op
+    current_mode = eradiate.mode()
+    eradiate.set_mode("mono")
+    assert eradiate.mode() is current_mode
+    assert mitsuba.variant() == "scalar_mono"
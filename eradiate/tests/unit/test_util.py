@@ -2,7 +2,7 @@ import numpy as np
 import pytest
 
 from eradiate import unit_registry as ureg
-from eradiate._util import Singleton, is_vector3
+from eradiate._util import Singleton, is_vector3, onedict_value
 
 
 def test_singleton():
@@ -14,6 +14,16 @@ def test_singleton():
     assert my_singleton1 is my_singleton2
 
 
+def test_onedict_value():
+    assert onedict_value({"a": 1}) == 1
+
+    with pytest.raises(ValueError):
+        onedict_value({})
+
+    with pytest.raises(ValueError):
+        onedict_value({"a": 1, "b": 2})
+
+
 vector3_test_data = [
     ("aaa", False),
     ([0, 1], False),
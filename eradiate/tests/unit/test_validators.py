@@ -2,7 +2,7 @@ import attr
 import pytest
 
 from eradiate import unit_registry as ureg
-from eradiate.validators import on_quantity
+from eradiate.validators import is_vector3, on_quantity
 
 
 def test_on_quantity():
@@ -21,3 +21,19 @@ def test_on_quantity():
 
     with pytest.raises(TypeError): v(None, attribute, "1.")
     with pytest.raises(TypeError): v(None, attribute, ureg.Quantity("1.", "km"))
+
+
+def test_is_vector3():
+    @attr.s
+    class Attribute:  # Tiny class to pass an appropriate attribute argument
+        name = attr.ib()
+
+    attribute = Attribute(name="attribute")
+
+    # This should succeed
+    is_vector3(None, attribute, [0, 0, 1])
+    is_vector3(None, attribute, (0.0, 0.5, 1.0))
+
+    # This should fail
+    with pytest.raises(ValueError): is_vector3(None, attribute, [0, 1])
+    with pytest.raises(TypeError): is_vector3(None, attribute, [0, 1, "2"])
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from eradiate import warp
@@ -15,7 +17,7 @@ def check_inverse(func, inverse):
 def test_square_to_uniform_disk_concentric():
     assert np.allclose(
         warp.square_to_uniform_disk_concentric([0, 0]),
-        ([-1 / np.sqrt(2), -1 / np.sqrt(2)]),
+        [-0.5 * math.sqrt(2.0), -0.5 * math.sqrt(2.0)],
     )
     assert np.allclose(warp.square_to_uniform_disk_concentric([0.5, 0.5]), [0, 0])
 
@@ -5,9 +5,18 @@ Atmospheric thermophysical properties profiles models according to
 These atmospheric profiles may be referred to as the AFGL 1986 atmospheric
 profiles in other parts of the documentation.
 """
+from functools import lru_cache
+
 import eradiate.data as data
 
 
+@lru_cache(maxsize=8)
+def _open_profile(model_id):
+    # Opening a data set hits the disk: profiles are loaded to memory once and
+    # cached
+    return data.open(category="thermoprops_profiles", id="afgl1986-" + model_id).load()
+
+
 def make_profile(model_id="us_standard"):
     """Makes the atmospheric profiles from the AFGL's 1986 technical report
     :cite:`Anderson1986AtmosphericConstituentProfiles`.
@@ -22,4 +31,6 @@ def make_profile(model_id="us_standard"):
     Returns → :class:`xarray.Dataset`:
         Atmospheric profile.
     """
-    return data.open(category="thermoprops_profiles", id="afgl1986-" + model_id)
+    # Deep copy: callers may modify the returned data set in place, which must
+    # not alter the cached one
+    return _open_profile(model_id).copy(deep=True)
@@ -8,6 +8,7 @@ from eradiate.thermoprops.util import (
     _find_regular_params_gcd,
     _to_regular,
     compute_column_number_density,
+    compute_mass_density_at_surface,
     compute_number_density_at_surface,
     compute_scaling_factors,
     equilibrium_water_vapor_fraction,
@@ -129,6 +130,28 @@ def test_compute_scaling_factors():
     assert np.isclose(factors["O3"], 2.0, rtol=1e-9)
 
 
+def test_compute_scaling_factors_mass_density():
+    # a mass density is interpreted as a mass density at the surface
+    ds = xr.Dataset(
+        data_vars={
+            "mr": (("species", "z_layer"), 0.5 * np.ones((2, 3)), {"units": ""}),
+            "n": ("z_layer", 2.687e20 * np.ones(3), {"units": "m^-3"}),
+        },
+        coords={
+            "z_layer": ("z_layer", [0.5, 2.0, 6.5], {"units": "m"}),
+            "z_level": ("z_level", [0.0, 1.0, 3.0, 10.0], {"units": "m"}),
+            "species": ("species", ["H2O", "O3"], {}),
+        },
+    )
+    surface_mass_density = compute_mass_density_at_surface(ds=ds, species="H2O")
+
+    # target is expressed in different units to check conversion
+    factors = compute_scaling_factors(
+        ds=ds, concentration={"H2O": 2.0 * surface_mass_density.to("g/m^3")}
+    )
+    assert np.isclose(factors["H2O"], 2.0, rtol=1e-9)
+
+
 def test_human_readable():
     assert human_readable(["a", "b", "c"]) == "a, b and c"
 
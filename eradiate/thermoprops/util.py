@@ -20,6 +20,14 @@ ATOMIC_MASS_CONSTANT = ureg.Quantity(
     *scipy.constants.physical_constants["atomic mass constant"][:-1]
 )
 
+# Dimensionalities of the concentration kinds supported by
+# compute_scaling_factors(), resolved once
+_DIM_COLUMN_NUMBER_DENSITY = ureg.Unit("m^-2").dimensionality
+_DIM_COLUMN_MASS_DENSITY = ureg.Unit("kg/m^2").dimensionality
+_DIM_NUMBER_DENSITY = ureg.Unit("m^-3").dimensionality
+_DIM_MASS_DENSITY = ureg.Unit("kg/m^3").dimensionality
+_DIM_DIMENSIONLESS = ureg.dimensionless.dimensionality
+
 
 def compute_column_number_density(ds, species):
     """
@@ -192,19 +200,20 @@ def compute_scaling_factors(ds, concentration):
     factors = {}
     for species in concentration:
         amount = concentration[species]
-        if amount.check("[length]^-2"):  # column number density
+        dimensionality = amount.dimensionality
+        if dimensionality == _DIM_COLUMN_NUMBER_DENSITY:
             initial_amount = compute_column_number_density(ds=ds, species=species)
             factor = amount.to("m^-2") / initial_amount.to("m^-2")
-        elif amount.check("[mass] * [length]^-2"):
+        elif dimensionality == _DIM_COLUMN_MASS_DENSITY:
             initial_amount = compute_column_mass_density(ds=ds, species=species)
             factor = amount.to("kg/m^2") / initial_amount.to("kg/m^2")
-        elif amount.check("[length]^-3"):  # number density at the surface
+        elif dimensionality == _DIM_NUMBER_DENSITY:  # at the surface
             initial_amount = compute_number_density_at_surface(ds=ds, species=species)
             factor = amount.to("m^-3") / initial_amount.to("m^-3")
-        elif amount.check("[mass] * [length]^-2"):
+        elif dimensionality == _DIM_MASS_DENSITY:  # at the surface
             initial_amount = compute_mass_density_at_surface(ds=ds, species=species)
-            factor = amount.to("km/m^3") / initial_amount.to("kg/m^3")
-        elif amount.check(""):  # mixing ratio at the surface
+            factor = amount.to("kg/m^3") / initial_amount.to("kg/m^3")
+        elif dimensionality == _DIM_DIMENSIONLESS:  # mixing ratio at the surface
             surface_mr_species = amount
             initial_surface_mr_species = to_quantity(ds.mr.sel(species=species))[0]
             factor = surface_mr_species / initial_surface_mr_species
@@ -254,26 +263,33 @@ def rescale_concentration(ds, factors, inplace=False):
         If ``True``, the atmosphere thermophysical properties data set object
         is modified.
         Else, a new atmosphere thermophysical properties data set object is
-        returned.
+        returned. It shares all variables but ``mr`` with ``ds``.
 
     Returns → :class:`~xarray.Dataset`:
         Rescaled atmosphere thermophysical properties data set.
     """
     if not inplace:
-        ds = ds.copy(deep=True)
-
-    mr = ds.mr.values
-    for i, species in enumerate(ds.species.values):
-        if species in factors:
-            mr[i] *= factors[species]
+        # Only the mixing ratio variable is replaced: other variables can be
+        # shared with the initial data set
+        ds = ds.copy(deep=False)
+
+    # Rescale all species in a single broadcast product
+    species_factors = xr.DataArray(
+        [factors.get(species, 1.0) for species in ds.species.values],
+        dims="species",
+    )
+    mr = (ds.mr * species_factors).assign_attrs(ds.mr.attrs)
+    mr_sum = mr.sum(dim="species")
 
-    if any(mr.sum(axis=0) > 1.0):
+    if (mr_sum > 1.0).any():
         raise ValueError(
             f"Cannot rescale concentration with these factors "
             f"({factors}) because the sum of mixing ratios would "
-            f"be larger than 1: {mr.sum(axis=0)}"
+            f"be larger than 1: {mr_sum.values}"
         )
 
+    ds["mr"] = mr
+
     species = list(factors.keys())
     ds.attrs["history"] += (
         f"\n"
@@ -330,9 +346,14 @@ def interpolate(ds, z_level, method="linear", conserve_columns=False):
     )
 
     if conserve_columns:
-        initial_amounts = {
-            s: compute_column_number_density(ds, s) for s in ds.species.values
-        }
+        # Column number densities of all species, computed in a single pass
+        # (equivalent to calling compute_column_number_density() for each one)
+        n = to_quantity(ds.n)
+        z_level_ds = to_quantity(ds.z_level)
+        dz = z_level_ds[1:] - z_level_ds[:-1]
+        mr = ds.mr.transpose("species", "z_layer").values
+        columns = (mr * (n * dz)).sum(axis=1)
+        initial_amounts = dict(zip(ds.species.values, columns))
         factors = compute_scaling_factors(
             ds=interpolated, concentration=initial_amounts
         )
@@ -1,6 +1,7 @@
 __all__ = [
     "symbol",
     "to_quantity",
+    "units_compatible",
 ]
 
 
@@ -39,22 +40,43 @@ class PhysicalQuantity(enum.Enum):
     WAVELENGTH = "wavelength"
 
     @classmethod
-    @lru_cache(maxsize=32)
     def spectrum(cls):
         """
         Return a tuple containing a subset of :class:`PhysicalQuantity`
-        members suitable for :class:`.Spectrum` initialisation. This function
-        caches its results for improved efficiency.
+        members suitable for :class:`.Spectrum` initialisation.
         """
-        return (
-            cls.ALBEDO,
-            cls.COLLISION_COEFFICIENT,
-            cls.DIMENSIONLESS,
-            cls.IRRADIANCE,
-            cls.RADIANCE,
-            cls.REFLECTANCE,
-            cls.TRANSMITTANCE,
-        )
+        return _SPECTRUM_QUANTITIES
+
+
+# Constant: built once, returned by PhysicalQuantity.spectrum()
+_SPECTRUM_QUANTITIES = (
+    PhysicalQuantity.ALBEDO,
+    PhysicalQuantity.COLLISION_COEFFICIENT,
+    PhysicalQuantity.DIMENSIONLESS,
+    PhysicalQuantity.IRRADIANCE,
+    PhysicalQuantity.RADIANCE,
+    PhysicalQuantity.REFLECTANCE,
+    PhysicalQuantity.TRANSMITTANCE,
+)
+
+
+# Default units of base and simple derived quantities; built once and shared
+# by all unit contexts
+_UNIT_CONTEXT_DEFAULTS = {
+    # We allow for dimensionless quantities
+    PhysicalQuantity.DIMENSIONLESS: unit_registry.dimensionless,
+    # Basic quantities must be named after their SI name
+    # https://en.wikipedia.org/wiki/International_System_of_Units
+    PhysicalQuantity.LENGTH: unit_registry.m,
+    PhysicalQuantity.TIME: unit_registry.s,
+    PhysicalQuantity.MASS: unit_registry.kg,
+    # Derived quantity names are more flexible
+    PhysicalQuantity.ALBEDO: unit_registry.dimensionless,
+    PhysicalQuantity.ANGLE: unit_registry.deg,
+    PhysicalQuantity.REFLECTANCE: unit_registry.dimensionless,
+    PhysicalQuantity.TRANSMITTANCE: unit_registry.dimensionless,
+    PhysicalQuantity.WAVELENGTH: unit_registry.nm,
+}
 
 
 def _make_unit_context():
@@ -62,24 +84,9 @@ def _make_unit_context():
         interpret_str=True, ureg=unit_registry, key_converter=PhysicalQuantity
     )
 
-    # fmt: off
-    for key, value in {
-        # We allow for dimensionless quantities
-        PhysicalQuantity.DIMENSIONLESS: pinttr.UnitGenerator(unit_registry.dimensionless),
-        # Basic quantities must be named after their SI name
-        # https://en.wikipedia.org/wiki/International_System_of_Units
-        PhysicalQuantity.LENGTH: pinttr.UnitGenerator(unit_registry.m),
-        PhysicalQuantity.TIME: pinttr.UnitGenerator(unit_registry.s),
-        PhysicalQuantity.MASS: pinttr.UnitGenerator(unit_registry.kg),
-        # Derived quantity names are more flexible
-        PhysicalQuantity.ALBEDO: pinttr.UnitGenerator(unit_registry.dimensionless),
-        PhysicalQuantity.ANGLE: pinttr.UnitGenerator(unit_registry.deg),
-        PhysicalQuantity.REFLECTANCE: pinttr.UnitGenerator(unit_registry.dimensionless),
-        PhysicalQuantity.TRANSMITTANCE: pinttr.UnitGenerator(unit_registry.dimensionless),
-        PhysicalQuantity.WAVELENGTH: pinttr.UnitGenerator(unit_registry.nm),
-    }.items():
-        uctx.register(key, value)
-    # fmt: on
+    # Each context gets its own generators so that overrides remain independent
+    for key, units in _UNIT_CONTEXT_DEFAULTS.items():
+        uctx.register(key, pinttr.UnitGenerator(units))
 
     # The following quantities will update automatically based on their parent units
     uctx.register(
@@ -117,6 +124,12 @@ unit_context_kernel = _make_unit_context()
 # -- Public functions ----------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
+def _unit_cached(units: str) -> pint.Unit:
+    # Parsing unit strings is slow: cache results for repeatedly used strings
+    return unit_registry.Unit(units)
+
+
 def symbol(units: Union[pint.Unit, str]) -> str:
     """
     Normalise a string or Pint units to a symbol string.
@@ -127,7 +140,11 @@ def symbol(units: Union[pint.Unit, str]) -> str:
     Returns → str:
         Symbol string (*e.g.* 'm' for 'metre', 'W / m ** 2' for 'W/m^2', etc.).
     """
-    units = unit_registry.Unit(units)
+    if isinstance(units, str):
+        units = _unit_cached(units)
+    else:
+        units = unit_registry.Unit(units)
+
     return format(units, "~")
 
 
@@ -138,6 +155,10 @@ def to_quantity(da: xarray.DataArray) -> pint.Quantity:
 
     .. note:: This function can also be used on coordinate variables.
 
+    .. note:: The array's data is wrapped without copy or materialisation
+       (*e.g.* dask-backed arrays are not computed). Callers which need to
+       modify the returned magnitude should copy it first.
+
     Parameter ``da`` (:class:`~xarray.DataArray`):
         :class:`~xarray.DataArray` instance which will be converted.
 
@@ -152,4 +173,25 @@ def to_quantity(da: xarray.DataArray) -> pint.Quantity:
     except KeyError as e:
         raise ValueError("this DataArray has no 'units' metadata field") from e
     else:
-        return unit_registry.Quantity(da.values, units)
+        return unit_registry.Quantity(da.data, units)
+
+
+@lru_cache(maxsize=128)
+def units_compatible(units1: pint.Unit, units2: pint.Unit) -> bool:
+    """
+    Check if two units are compatible (*i.e.* have the same dimensionality).
+
+    .. note:: Results are cached: unit-checked fields repeatedly compare the
+       same unit pairs.
+
+    Parameter ``units1`` (:class:`pint.Unit`):
+        First unit.
+
+    Parameter ``units2`` (:class:`pint.Unit`):
+        Second unit.
+
+    Returns → bool:
+        ``True`` if ``units1`` and ``units2`` are compatible, ``False``
+        otherwise.
+    """
+    return pinttr.util.units_compatible(units1, units2)
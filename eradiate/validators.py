@@ -1,6 +1,6 @@
+from functools import lru_cache
 from numbers import Number
 
-import attr
 import numpy as np
 
 from .attrs import AUTO
@@ -22,9 +22,15 @@ def is_number(_, attribute, value):
 
 def is_vector3(instance, attribute, value):
     """Validates if ``value`` is convertible to a 3-vector."""
-    return attr.validators.deep_iterable(
-        member_validator=is_number, iterable_validator=has_len(3)
-    )(instance, attribute, value)
+    # Equivalent to attr.validators.deep_iterable(is_number, has_len(3)),
+    # without building the combinator chain on each call
+    if len(value) != 3:
+        raise ValueError(
+            f"{attribute} must be have length 3, got {value} of length {len(value)}"
+        )
+
+    for member in value:
+        is_number(instance, attribute, member)
 
 
 def is_positive(_, attribute, value):
@@ -43,7 +49,12 @@ def all_positive(_, attribute, value):
     """
     if isinstance(value, ureg.Quantity):
         value = value.magnitude
-    if not np.all(np.array(value) >= 0):
+    # Arrays are checked with a single reduction and without copy
+    if isinstance(value, np.ndarray):
+        passed = value.size == 0 or value.min() >= 0
+    else:
+        passed = np.all(np.asarray(value) >= 0)
+    if not passed:
         raise ValueError(f"{attribute} must be all positive or zero, got {value}")
 
 
@@ -78,10 +89,12 @@ def is_dir(_, attribute, value):
         )
 
 
+@lru_cache(maxsize=None)
 def has_len(size):
     """
     Generates a validator which validates if ``value`` is of length ``size``.
     The generated validator will raise a ``ValueError`` in case of failure.
+    Generated validators are cached and reused.
 
     Parameter ``size`` (int):
         Size required to pass validation.
@@ -100,15 +113,17 @@ def has_len(size):
     return f
 
 
+@lru_cache(maxsize=None)
 def has_quantity(quantity):
     """
     Validates if the validated value has a quantity field matching the
-    ``quantity`` parameter."""
+    ``quantity`` parameter. Generated validators are cached and reused."""
 
     quantity = PhysicalQuantity(quantity)
 
     def f(_, attribute, value):
-        if value.quantity != quantity:
+        # Enum members are singletons: compare by identity
+        if value.quantity is not quantity:
             raise ValueError(
                 f"incompatible quantity '{value.quantity}' "
                 f"used to set field '{attribute.name}' "
@@ -356,7 +356,7 @@ class VarSpec(DataSpec):
 
     def __attrs_post_init__(self):
         args = (self.standard_name, self.long_name)
-        if not (all([x is None for x in args]) or all([x is not None for x in args])):
+        if not (all(x is None for x in args) or all(x is not None for x in args)):
             raise ValueError(
                 "either all or none of 'standard_name' and " "'long_name' must be None"
             )
@@ -505,8 +505,8 @@ class DatasetSpec(DataSpec):
         }
 
         if not (
-            all([x is None for x in args.values()])
-            or all([x is not None for x in args.values()])
+            all(x is None for x in args.values())
+            or all(x is not None for x in args.values())
         ):
             raise ValueError(
                 "either all or none of 'convention', 'title', "
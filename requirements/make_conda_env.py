@@ -29,7 +29,7 @@ def cli(sections, input, output, quiet):
 
     # Load environment file template
     with open(os.path.join("requirements", "environment.in")) as f:
-        env_yml = yaml.load(f.read())
+        env_yml = yaml.load(f)
 
     # Extract dependency section contents
     if not quiet:
@@ -44,7 +44,7 @@ def cli(sections, input, output_dir, layered_config, quiet):
     # Load layered dependency dependencies
     yaml = YAML(typ="safe")
     with open(layered_config) as f:
-        layered_yml = yaml.load(f.read())
+        layered_yml = yaml.load(f)
 
     for section in sections:
         if not quiet: